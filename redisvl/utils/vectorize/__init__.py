@@ -4,7 +4,10 @@ from redisvl.utils.vectorize.text.cohere import CohereTextVectorizer
 from redisvl.utils.vectorize.text.custom import CustomTextVectorizer
 from redisvl.utils.vectorize.text.huggingface import HFTextVectorizer
 from redisvl.utils.vectorize.text.mistral import MistralAITextVectorizer
-from redisvl.utils.vectorize.text.openai import OpenAITextVectorizer
+from redisvl.utils.vectorize.text.openai import (
+    BatchingOpenAITextVectorizer,
+    OpenAITextVectorizer,
+)
 from redisvl.utils.vectorize.text.vertexai import VertexAITextVectorizer
 
 __all__ = [
@@ -12,6 +15,7 @@ __all__ = [
     "CohereTextVectorizer",
     "HFTextVectorizer",
     "OpenAITextVectorizer",
+    "BatchingOpenAITextVectorizer",
     "VertexAITextVectorizer",
     "AzureOpenAITextVectorizer",
     "MistralAITextVectorizer",
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import Callable, List, Optional
 
+import numpy as np
 from pydantic.v1 import BaseModel, validator
 
 from redisvl.redis.utils import array_to_buffer
@@ -61,13 +63,23 @@ class BaseVectorizer(BaseModel, ABC):
         raise NotImplementedError
 
     def batchify(self, seq: list, size: int, preprocess: Optional[Callable] = None):
-        for pos in range(0, len(seq), size):
-            if preprocess is not None:
-                yield [preprocess(chunk) for chunk in seq[pos : pos + size]]
-            else:
-                yield seq[pos : pos + size]
+        if size <= 0:
+            raise ValueError(f"Batch size must be a positive integer, got {size}")
+        # preprocess lazily while filling each batch, without slicing copies
+        items = iter(seq) if preprocess is None else map(preprocess, seq)
+        while batch := list(islice(items, size)):
+            yield batch
 
     def _process_embedding(self, embedding: List[float], as_buffer: bool):
         if as_buffer:
             return array_to_buffer(embedding)
         return embedding
+
+    def _process_embeddings(
+        self, embeddings: List[List[float]], as_buffer: bool, dtype: str = "float32"
+    ):
+        if as_buffer:
+            # convert the whole batch in a single array rather than per row
+            array = np.asarray(embeddings, dtype=dtype)
+            return [row.tobytes() for row in array]
+        return embeddings
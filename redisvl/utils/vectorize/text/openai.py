@@ -1,15 +1,224 @@
+import asyncio
+import base64
+import hashlib
 import os
-from typing import Any, Callable, Dict, List, Optional
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 from pydantic.v1 import PrivateAttr
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 from tenacity.retry import retry_if_not_exception_type
+from tenacity.wait import wait_base
 
 from redisvl.utils.vectorize.base import BaseVectorizer
 
 # ignore that openai isn't imported
 # mypy: disable-error-code="name-defined"
 
+# OpenAI caps the number of inputs accepted by a single embeddings request,
+# the tokens summed across those inputs, and the tokens of each input
+_MAX_INPUTS_PER_REQUEST = 2048
+_MAX_TOKENS_PER_REQUEST = 300_000
+_MAX_TOKENS_PER_INPUT = 8191
+
+# Vector datatypes supported by Redis vector fields
+_VECTOR_DTYPES = ("float32", "float64")
+
+# Default output dimensions of known OpenAI embedding models
+_MODEL_DIMS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
+_get_embedding = attrgetter("embedding")
+
+
+def _validate_dtype(dtype: str) -> str:
+    dtype = dtype.lower()
+    if dtype not in _VECTOR_DTYPES:
+        raise ValueError(
+            f"Invalid dtype: {dtype}. Supported dtypes: {', '.join(_VECTOR_DTYPES)}"
+        )
+    return dtype
+
+
+def _convert_buffers(buffers: List[bytes], as_buffer: bool, dtype: str) -> List:
+    """Convert float32 embedding buffers to byte strings of the given dtype
+    or to float lists, with one vectorized cast over the whole batch."""
+    if as_buffer and dtype == "float32":
+        return buffers
+    if not buffers:
+        return []
+    if len(set(map(len, buffers))) > 1:
+        raise ValueError("Cannot convert embeddings of different dimensions.")
+    array = np.frombuffer(b"".join(buffers), dtype="<f4").reshape(len(buffers), -1)
+    if as_buffer:
+        return [row.tobytes() for row in array.astype(dtype)]
+    return array.tolist()
+
+
+# Durations such as "1s", "6m0s" or "20ms" in OpenAI rate limit reset headers
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_after(exception: Optional[BaseException]) -> Optional[float]:
+    """Extract the delay in seconds requested by the server for a failed
+    request, or None if the response does not specify one."""
+    response = getattr(exception, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        try:
+            return float(headers["retry-after"])
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(headers["retry-after"])
+                return max(retry_at.timestamp() - time.time(), 0)
+            except (TypeError, ValueError):
+                pass
+
+    # the rate limit reset headers are sent on every response, so they only
+    # say how long to wait when the request was actually rate limited
+    if getattr(response, "status_code", None) == 429:
+        resets = [
+            _parse_duration(headers[header])
+            for header in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+            if header in headers
+        ]
+        delays = [delay for delay in resets if delay is not None]
+        if delays:
+            return max(delays)
+    return None
+
+
+class _wait_retry_after(wait_base):
+    """Wait for the delay requested by the server's Retry-After or rate limit
+    reset headers, plus a little jitter, falling back to another wait strategy
+    when the failed response does not specify one. The server's delay is
+    honored in full, since retrying any sooner is bound to be rejected, but a
+    delay longer than `max_wait` re-raises the failure instead of blocking
+    the caller."""
+
+    def __init__(self, fallback: wait_base, max_wait: float = 60):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        delay = _retry_after(exception)
+        if delay is None:
+            return self.fallback(retry_state)
+        if delay > self.max_wait:
+            raise exception
+        return delay + random.uniform(0, 0.25)
+
+
+class _PersistentEmbeddingCache:
+    """SQLite-backed store of float32 embedding buffers, keyed by the SHA-256
+    of the model, output dimensions and text, that outlives the process."""
+
+    # stay below SQLite's limit on the number of variables in a statement
+    _QUERY_BATCH_SIZE = 500
+
+    def __init__(self, path: str, model: str):
+        self._model = model
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, model TEXT NOT NULL, embedding BLOB NOT NULL)"
+            )
+
+    def _key(self, text: str, dimensions: Optional[int]) -> bytes:
+        key = f"{self._model}\0{dimensions or ''}\0{text}"
+        return hashlib.sha256(key.encode()).digest()
+
+    def get_many(
+        self, texts: List[str], dimensions: Optional[int] = None
+    ) -> List[Optional[bytes]]:
+        """Fetch the stored buffer for each text, or None if missing."""
+        keys = [self._key(text, dimensions) for text in texts]
+        found: Dict[bytes, bytes] = {}
+        with self._lock:
+            for pos in range(0, len(keys), self._QUERY_BATCH_SIZE):
+                chunk = keys[pos : pos + self._QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    self._conn.execute(
+                        "SELECT key, embedding FROM embeddings "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    )
+                )
+        return [found.get(key) for key in keys]
+
+    def set_many(
+        self, texts: List[str], buffers: List[bytes], dimensions: Optional[int] = None
+    ):
+        """Store a buffer for each text."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)",
+                [
+                    (self._key(text, dimensions), self._model, buffer)
+                    for text, buffer in zip(texts, buffers)
+                ],
+            )
+
+
+# OpenAI clients shared by vectorizers configured with the same API key and
+# options, so that their connection pools are reused across instances
+_CLIENT_CACHE: Dict[Tuple, Any] = {}
+
+# Async clients hold connections bound to the event loop that opened them, so
+# they are shared per loop, alongside the generator that closes them when the
+# loop shuts down
+_ASYNC_CLIENT_CACHE: Dict[Any, Tuple[Dict[Tuple, Tuple[Any, bool]], Any]] = {}
+
+
+async def _close_clients_on_shutdown(
+    loop: asyncio.AbstractEventLoop, clients: Dict[Tuple, Tuple[Any, bool]]
+):
+    """Suspend until the loop finalizes its async generators on shutdown, as
+    `asyncio.run` does, then close the clients opened on it while the loop
+    can still run their cleanup."""
+    try:
+        yield
+    finally:
+        _ASYNC_CLIENT_CACHE.pop(loop, None)
+        # leave clients built on a caller's own http_client open
+        await asyncio.gather(
+            *(client.close() for client, owned in clients.values() if owned),
+            return_exceptions=True,
+        )
+
 
 class OpenAITextVectorizer(BaseVectorizer):
     """The OpenAITextVectorizer class utilizes OpenAI's API to generate
@@ -45,9 +254,22 @@ class OpenAITextVectorizer(BaseVectorizer):
 
     _client: Any = PrivateAttr()
     _aclient: Any = PrivateAttr()
+    _client_key: Tuple = PrivateAttr()
+    _client_options: Tuple[str, Dict] = PrivateAttr()
+    _dimensions: Optional[int] = PrivateAttr(default=None)
+    _encoder: Any = PrivateAttr(default=None)
+    _cache_size: int = PrivateAttr(default=0)
+    _cache: Any = PrivateAttr(default=None)
+    _acache: Any = PrivateAttr(default=None)
+    _inflight: Dict[Tuple, Any] = PrivateAttr(default_factory=dict)
+    _persistent_cache: Any = PrivateAttr(default=None)
 
     def __init__(
-        self, model: str = "text-embedding-ada-002", api_config: Optional[Dict] = None
+        self,
+        model: str = "text-embedding-ada-002",
+        api_config: Optional[Dict] = None,
+        cache_size: int = 0,
+        persistent_cache_path: Optional[str] = None,
     ):
         """Initialize the OpenAI vectorizer.
 
@@ -55,14 +277,30 @@ class OpenAITextVectorizer(BaseVectorizer):
             model (str): Model to use for embedding. Defaults to
                 'text-embedding-ada-002'.
             api_config (Optional[Dict], optional): Dictionary containing the
-                API key and any additional OpenAI API options. Defaults to None.
+                API key and any additional OpenAI API options. A `dimensions`
+                entry requests shortened embeddings from models that support
+                it. Defaults to None.
+            cache_size (int, optional): Number of single-text embeddings to
+                keep in an in-memory LRU cache for `embed` and `aembed`. A
+                value of 0 disables caching. Defaults to 0.
+            persistent_cache_path (Optional[str], optional): Path of a SQLite
+                database in which `embed_many` and `aembed_many` persist
+                embeddings across runs, so unchanged texts are not embedded
+                again. Defaults to None.
 
         Raises:
             ImportError: If the openai library is not installed.
             ValueError: If the OpenAI API key is not provided.
         """
+        dimensions = api_config.pop("dimensions", None) if api_config else None
         self._initialize_clients(api_config)
-        super().__init__(model=model, dims=self._set_model_dims(model))
+        super().__init__(model=model, dims=self._set_model_dims(model, dimensions))
+        self._dimensions = dimensions
+        self._initialize_cache(cache_size)
+        if persistent_cache_path:
+            self._persistent_cache = _PersistentEmbeddingCache(
+                persistent_cache_path, model
+            )
 
     def _initialize_clients(self, api_config: Optional[Dict]):
         """
@@ -74,7 +312,7 @@ class OpenAITextVectorizer(BaseVectorizer):
 
         # Dynamic import of the openai module
         try:
-            from openai import AsyncOpenAI, OpenAI
+            from openai import OpenAI
         except ImportError:
             raise ImportError(
                 "OpenAI vectorizer requires the openai library. \
@@ -92,10 +330,117 @@ class OpenAITextVectorizer(BaseVectorizer):
                     environment variable."
             )
 
-        self._client = OpenAI(api_key=api_key, **api_config)
-        self._aclient = AsyncOpenAI(api_key=api_key, **api_config)
+        # Reuse the clients of an identically configured vectorizer when the
+        # options are hashable
+        cache_key: Optional[Tuple] = (api_key, tuple(sorted(api_config.items())))
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+        # otherwise async clients are only shared by this instance
+        self._client_key = cache_key if cache_key is not None else (object(),)
+        self._client_options = (api_key, api_config)
+
+        # The async client is created lazily on the running event loop
+        self._aclient = None
+
+        if cache_key in _CLIENT_CACHE:
+            self._client = _CLIENT_CACHE[cache_key]
+            return
+
+        if "http_client" in api_config:
+            self._client = OpenAI(api_key=api_key, **api_config)
+        else:
+            self._client = OpenAI(
+                api_key=api_key,
+                http_client=self._initialize_http_client(),
+                **api_config,
+            )
+
+        if cache_key is not None:
+            self._client = _CLIENT_CACHE.setdefault(cache_key, self._client)
 
-    def _set_model_dims(self, model) -> int:
+    @staticmethod
+    def _initialize_http_client(client_class: Optional[type] = None) -> Any:
+        """
+        Setup an httpx client, sync by default, whose connection pool keeps
+        enough connections alive for concurrent batch requests. HTTP/2 is
+        enabled when the optional h2 package is installed.
+        """
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=64, max_keepalive_connections=64, keepalive_expiry=60
+        )
+        client_class = client_class or httpx.Client
+        return client_class(http2=http2, limits=limits, follow_redirects=True)
+
+    async def _get_aclient(self) -> Any:
+        """
+        Get the async OpenAI client for the running event loop, creating it
+        on first use. Clients are shared per loop between identically
+        configured vectorizers, as their connections cannot outlive the loop
+        that opened them, and are closed when the loop shuts down.
+        """
+        if self._aclient is not None:
+            return self._aclient
+
+        loop = asyncio.get_running_loop()
+        if loop not in _ASYNC_CLIENT_CACHE:
+            # drop the clients of loops closed without finalizing their async
+            # generators, so that they and their connections can be collected
+            for closed in [other for other in _ASYNC_CLIENT_CACHE if other.is_closed()]:
+                _ASYNC_CLIENT_CACHE.pop(closed, None)
+
+            clients: Dict[Tuple, Tuple[Any, bool]] = {}
+            closer = _close_clients_on_shutdown(loop, clients)
+            # advance to the yield so the loop tracks the generator
+            await closer.__anext__()
+            _ASYNC_CLIENT_CACHE[loop] = (clients, closer)
+
+        clients = _ASYNC_CLIENT_CACHE[loop][0]
+        if self._client_key not in clients:
+            owned = "http_client" not in self._client_options[1]
+            clients[self._client_key] = (self._initialize_aclient(), owned)
+        return clients[self._client_key][0]
+
+    def _initialize_aclient(self) -> Any:
+        from openai import AsyncOpenAI
+
+        api_key, api_config = self._client_options
+        if "http_client" in api_config:
+            return AsyncOpenAI(api_key=api_key, **api_config)
+
+        import httpx
+
+        return AsyncOpenAI(
+            api_key=api_key,
+            http_client=self._initialize_http_client(httpx.AsyncClient),
+            **api_config,
+        )
+
+    def _initialize_cache(self, cache_size: int):
+        """Setup the LRU caches used by `embed` and `aembed`."""
+        if cache_size < 0:
+            raise ValueError("cache_size must be a non-negative integer.")
+        self._cache_size = cache_size
+        if cache_size > 0:
+            self._cache = lru_cache(maxsize=cache_size)(self._embed_uncached)
+            self._acache = OrderedDict()
+
+    def _set_model_dims(self, model, dimensions: Optional[int] = None) -> int:
+        # skip the round trip to the API when the dimensions are known
+        if dimensions:
+            return dimensions
+        if model in _MODEL_DIMS:
+            return _MODEL_DIMS[model]
         try:
             embedding = (
                 self._client.embeddings.create(input=["dimension test"], model=model)
@@ -109,59 +454,264 @@ class OpenAITextVectorizer(BaseVectorizer):
             raise ValueError(f"Error setting embedding model dimensions: {str(e)}")
         return len(embedding)
 
+    def _initialize_encoder(self) -> Any:
+        """Load the tiktoken encoding for the model, or return False when
+        tiktoken is not installed."""
+        try:
+            import tiktoken
+        except ImportError:
+            return False
+        try:
+            return tiktoken.encoding_for_model(self.model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens in a text, falling back to a rough estimate of
+        four characters per token if tiktoken is unavailable."""
+        if self._encoder is None:
+            self._encoder = self._initialize_encoder()
+        if self._encoder:
+            return len(self._encoder.encode(text, disallowed_special=()))
+        return len(text) // 4
+
+    def _pack_batches(
+        self, texts: List[str], max_tokens: Optional[int], max_items: int
+    ) -> Iterator[List[str]]:
+        """Greedily pack texts into batches, flushing a batch whenever the
+        next text would exceed either the token or the item budget of a
+        request.
+
+        Raises:
+            ValueError: If a text is longer than the model accepts. This is
+                only checked for OpenAI's own models, when tiktoken gives
+                exact token counts.
+        """
+        if max_items <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        max_items = min(max_items, _MAX_INPUTS_PER_REQUEST)
+        max_tokens = min(max_tokens or _MAX_TOKENS_PER_REQUEST, _MAX_TOKENS_PER_REQUEST)
+        # models served from other OpenAI-compatible endpoints may accept
+        # longer inputs
+        check_inputs = bool(self._encoder) and self.model in _MODEL_DIMS
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = self._count_tokens(text)
+            if check_inputs and tokens > _MAX_TOKENS_PER_INPUT:
+                raise ValueError(
+                    f"Text of {tokens} tokens exceeds the limit of "
+                    f"{_MAX_TOKENS_PER_INPUT} tokens per input."
+                )
+            if batch and (
+                len(batch) >= max_items or batch_tokens + tokens > max_tokens
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    def _prepare_batches(
+        self, texts: List[str], max_tokens: Optional[int], batch_size: int
+    ) -> Tuple[List[int], List[List[str]]]:
+        """Sort texts by length and pack them into request batches. Returns
+        the sort order alongside the batches."""
+        order, sorted_texts = self._sort_by_length(texts)
+        return order, list(self._pack_batches(sorted_texts, max_tokens, batch_size))
+
+    @staticmethod
+    def _dedupe(texts: List[str]) -> Tuple[List[str], List[int]]:
+        """Collapse repeated texts. Returns the unique texts alongside the
+        position of each input text within them."""
+        unique: Dict[str, int] = {}
+        positions = [unique.setdefault(text, len(unique)) for text in texts]
+        return list(unique), positions
+
+    def _expand_duplicates(self, positions: List[int], items: List) -> List:
+        """Scatter items produced for unique texts back to every input."""
+        if len(items) == len(positions):
+            return items
+        return [self._copy_embedding(items[p]) for p in positions]
+
+    @staticmethod
+    def _sort_by_length(texts: List[str]) -> Tuple[List[int], List[str]]:
+        """Order texts by length so that each batch holds similarly sized
+        inputs. Returns the sort order alongside the sorted texts."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        return order, [texts[i] for i in order]
+
+    @staticmethod
+    def _restore_order(order: List[int], items: List) -> List:
+        """Scatter items produced in sorted order back to input order."""
+        restored: List = [None] * len(order)
+        for j, i in enumerate(order):
+            restored[i] = items[j]
+        return restored
+
+    def _request_options(self, **kwargs) -> Dict[str, Any]:
+        """Default options sent with every embeddings request, overridable
+        by the caller's kwargs."""
+        kwargs.setdefault("encoding_format", "base64")
+        if self._dimensions:
+            kwargs.setdefault("dimensions", self._dimensions)
+        return kwargs
+
+    def _process_response(
+        self, response: Any, as_buffer: bool, dtype: str = "float32"
+    ) -> List:
+        """Convert the embeddings in an API response.
+
+        Embeddings requested with `encoding_format="base64"` arrive as base64
+        strings of little-endian float32 values, which already are the byte
+        strings expected when `as_buffer` is set with the float32 dtype.
+        """
+        raw = list(map(_get_embedding, response.data))
+        if raw and isinstance(raw[0], str):
+            buffers = [base64.b64decode(embedding) for embedding in raw]
+            return _convert_buffers(buffers, as_buffer, dtype)
+        return self._process_embeddings(raw, as_buffer, dtype)
+
     @retry(
-        wait=wait_random_exponential(min=1, max=60),
+        wait=_wait_retry_after(wait_random_exponential(min=1, max=60)),
         stop=stop_after_attempt(6),
         retry=retry_if_not_exception_type(TypeError),
     )
+    def _embed_batch(self, batch: List[str], **kwargs) -> Any:
+        """Request embeddings for a single batch of texts.
+
+        Retries are applied to each request rather than to the calling
+        method, so that a transient failure does not re-issue requests for
+        batches that have already succeeded or re-run preprocessing.
+        """
+        return self._client.embeddings.create(
+            input=batch, model=self.model, **self._request_options(**kwargs)
+        )
+
     def embed_many(
         self,
         texts: List[str],
         preprocess: Optional[Callable] = None,
         batch_size: int = 10,
         as_buffer: bool = False,
+        dtype: str = "float32",
+        max_tokens: Optional[int] = None,
+        dedupe: bool = True,
+        max_workers: int = 8,
         **kwargs,
     ) -> List[List[float]]:
         """Embed many chunks of texts using the OpenAI API.
 
+        Batches are dispatched concurrently on a bounded thread pool and the
+        resulting embeddings are returned in input order.
+
         Args:
             texts (List[str]): List of text chunks to embed.
             preprocess (Optional[Callable], optional): Optional preprocessing
                 callable to perform before vectorization. Defaults to None.
-            batch_size (int, optional): Batch size of texts to use when creating
-                embeddings. Defaults to 10.
+            batch_size (int, optional): Maximum number of texts to send in a
+                single request. Defaults to 10.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            dtype (str, optional): The datatype of the byte string when
+                `as_buffer` is set, either "float32" or "float64". Defaults
+                to "float32".
+            max_tokens (Optional[int], optional): Maximum number of tokens,
+                summed across texts, to send in a single request. Defaults to
+                None, which uses OpenAI's per-request limit of 300,000.
+            dedupe (bool, optional): Whether to embed repeated texts only
+                once. Defaults to True.
+            max_workers (int, optional): The maximum number of batch requests
+                in flight at once. Defaults to 8.
 
         Returns:
             List[List[float]]: List of embeddings.
 
         Raises:
             TypeError: If the wrong input type is passed in for the text.
+            ValueError: If a text exceeds the model's per-input token limit.
         """
         if not isinstance(texts, list):
             raise TypeError("Must pass in a list of str values to embed.")
         if len(texts) > 0 and not isinstance(texts[0], str):
             raise TypeError("Must pass in a list of str values to embed.")
+        dtype = _validate_dtype(dtype)
 
-        embeddings: List = []
-        for batch in self.batchify(texts, batch_size, preprocess):
-            response = self._client.embeddings.create(input=batch, model=self.model)
-            embeddings += [
-                self._process_embedding(r.embedding, as_buffer) for r in response.data
-            ]
+        if preprocess:
+            texts = [preprocess(text) for text in texts]
+        if dedupe:
+            texts, positions = self._dedupe(texts)
+
+        if self._persistent_cache is None:
+            embeddings = self._embed_texts(
+                texts, batch_size, as_buffer, dtype, max_tokens, max_workers, **kwargs
+            )
+        else:
+            # embeddings of a different size are cached separately
+            dimensions = self._request_options(**kwargs).get("dimensions")
+            buffers = self._persistent_cache.get_many(texts, dimensions)
+            missing = [i for i, buffer in enumerate(buffers) if buffer is None]
+            if missing:
+                missing_texts = [texts[i] for i in missing]
+                new_buffers = self._embed_texts(
+                    missing_texts,
+                    batch_size,
+                    True,
+                    "float32",
+                    max_tokens,
+                    max_workers,
+                    **kwargs,
+                )
+                self._persistent_cache.set_many(missing_texts, new_buffers, dimensions)
+                for i, buffer in zip(missing, new_buffers):
+                    buffers[i] = buffer
+            embeddings = _convert_buffers(buffers, as_buffer, dtype)
+
+        if dedupe:
+            embeddings = self._expand_duplicates(positions, embeddings)
         return embeddings
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
-    )
+    def _embed_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        as_buffer: bool,
+        dtype: str,
+        max_tokens: Optional[int],
+        max_workers: int,
+        **kwargs,
+    ) -> List:
+        """Embed prepared texts in length-sorted, token-packed batches that
+        are dispatched on a thread pool."""
+        order, batches = self._prepare_batches(texts, max_tokens, batch_size)
+
+        def _embed(batch: List[str]) -> List:
+            # convert within the worker so each raw response is released as
+            # soon as its batch is done, rather than held until all finish
+            return self._process_response(
+                self._embed_batch(batch, **kwargs), as_buffer, dtype
+            )
+
+        embeddings: List = []
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for result in executor.map(_embed, batches):
+                embeddings += result
+        except BaseException:
+            # drop the queued batches instead of running them all, with
+            # retries, before the failure reaches the caller
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return self._restore_order(order, embeddings)
+
     def embed(
         self,
         text: str,
         preprocess: Optional[Callable] = None,
         as_buffer: bool = False,
+        dtype: str = "float32",
         **kwargs,
     ) -> List[float]:
         """Embed a chunk of text using the OpenAI API.
@@ -172,6 +722,11 @@ class OpenAITextVectorizer(BaseVectorizer):
                 perform before vectorization. Defaults to None.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            dtype (str, optional): The datatype of the byte string when
+                `as_buffer` is set, either "float32" or "float64". Defaults
+                to "float32".
+            **kwargs: Additional options for the embeddings request, such as
+                `dimensions`.
 
         Returns:
             List[float]: Embedding.
@@ -181,67 +736,206 @@ class OpenAITextVectorizer(BaseVectorizer):
         """
         if not isinstance(text, str):
             raise TypeError("Must pass in a str value to embed.")
+        dtype = _validate_dtype(dtype)
 
         if preprocess:
             text = preprocess(text)
-        result = self._client.embeddings.create(input=[text], model=self.model)
-        return self._process_embedding(result.data[0].embedding, as_buffer)
+        if self._cache is None or self._options_key(kwargs) is None:
+            return self._embed_uncached(text, as_buffer, dtype, **kwargs)
+        return self._copy_embedding(self._cache(text, as_buffer, dtype, **kwargs))
+
+    def _embed_uncached(
+        self, text: str, as_buffer: bool, dtype: str, **kwargs
+    ) -> List[float]:
+        result = self._embed_batch([text], **kwargs)
+        return self._process_response(result, as_buffer, dtype)[0]
+
+    @staticmethod
+    def _options_key(options: Dict[str, Any]) -> Optional[Tuple]:
+        """Hashable key of a call's request options, so that results for
+        different options are cached apart, or None if an option value is
+        unhashable."""
+        key = tuple(sorted(options.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _copy_embedding(embedding: Any) -> Any:
+        """Copy a shared embedding so one caller cannot mutate another's
+        result. Byte strings are immutable and are returned as is."""
+        if isinstance(embedding, list):
+            return list(embedding)
+        return embedding
 
     @retry(
-        wait=wait_random_exponential(min=1, max=60),
+        wait=_wait_retry_after(wait_random_exponential(min=1, max=60)),
         stop=stop_after_attempt(6),
         retry=retry_if_not_exception_type(TypeError),
     )
+    async def _aembed_batch(self, batch: List[str], **kwargs) -> Any:
+        """Asynchronously request embeddings for a single batch of texts.
+
+        Retries are applied to each request rather than to the calling
+        method, so that a transient failure does not re-issue requests for
+        batches that have already succeeded or re-run preprocessing.
+        """
+        aclient = await self._get_aclient()
+        return await aclient.embeddings.create(
+            input=batch, model=self.model, **self._request_options(**kwargs)
+        )
+
     async def aembed_many(
         self,
         texts: List[str],
         preprocess: Optional[Callable] = None,
         batch_size: int = 1000,
         as_buffer: bool = False,
+        dtype: str = "float32",
+        max_tokens: Optional[int] = None,
+        dedupe: bool = True,
+        max_concurrency: int = 5,
         **kwargs,
     ) -> List[List[float]]:
         """Asynchronously embed many chunks of texts using the OpenAI API.
 
+        Batches are dispatched concurrently, bounded by `max_concurrency`,
+        and the resulting embeddings are returned in input order.
+
         Args:
             texts (List[str]): List of text chunks to embed.
             preprocess (Optional[Callable], optional): Optional preprocessing callable to
                 perform before vectorization. Defaults to None.
-            batch_size (int, optional): Batch size of texts to use when creating
-                embeddings. Defaults to 10.
+            batch_size (int, optional): Maximum number of texts to send in a
+                single request. Defaults to 1000.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            dtype (str, optional): The datatype of the byte string when
+                `as_buffer` is set, either "float32" or "float64". Defaults
+                to "float32".
+            max_tokens (Optional[int], optional): Maximum number of tokens,
+                summed across texts, to send in a single request. Defaults to
+                None, which uses OpenAI's per-request limit of 300,000.
+            dedupe (bool, optional): Whether to embed repeated texts only
+                once. Defaults to True.
+            max_concurrency (int, optional): The maximum number of batch
+                requests in flight at once. Defaults to 5.
 
         Returns:
             List[List[float]]: List of embeddings.
 
         Raises:
             TypeError: If the wrong input type is passed in for the text.
+            ValueError: If a text exceeds the model's per-input token limit,
+                or max_concurrency is not positive.
         """
         if not isinstance(texts, list):
             raise TypeError("Must pass in a list of str values to embed.")
         if len(texts) > 0 and not isinstance(texts[0], str):
             raise TypeError("Must pass in a list of str values to embed.")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer.")
+        dtype = _validate_dtype(dtype)
 
-        embeddings: List = []
-        for batch in self.batchify(texts, batch_size, preprocess):
-            response = await self._aclient.embeddings.create(
-                input=batch, model=self.model
+        if preprocess:
+            # run preprocessing off the event loop so in-flight requests proceed
+            texts = await asyncio.to_thread(
+                lambda: [preprocess(text) for text in texts]
+            )
+        if dedupe:
+            texts, positions = self._dedupe(texts)
+
+        if self._persistent_cache is None:
+            embeddings = await self._aembed_texts(
+                texts,
+                batch_size,
+                as_buffer,
+                dtype,
+                max_tokens,
+                max_concurrency,
+                **kwargs,
+            )
+        else:
+            # embeddings of a different size are cached separately, and
+            # blocking disk reads and writes are kept off the event loop
+            dimensions = self._request_options(**kwargs).get("dimensions")
+            buffers = await asyncio.to_thread(
+                self._persistent_cache.get_many, texts, dimensions
             )
-            embeddings += [
-                self._process_embedding(r.embedding, as_buffer) for r in response.data
-            ]
+            missing = [i for i, buffer in enumerate(buffers) if buffer is None]
+            if missing:
+                missing_texts = [texts[i] for i in missing]
+                new_buffers = await self._aembed_texts(
+                    missing_texts,
+                    batch_size,
+                    True,
+                    "float32",
+                    max_tokens,
+                    max_concurrency,
+                    **kwargs,
+                )
+                await asyncio.to_thread(
+                    self._persistent_cache.set_many,
+                    missing_texts,
+                    new_buffers,
+                    dimensions,
+                )
+                for i, buffer in zip(missing, new_buffers):
+                    buffers[i] = buffer
+            embeddings = _convert_buffers(buffers, as_buffer, dtype)
+
+        if dedupe:
+            embeddings = self._expand_duplicates(positions, embeddings)
         return embeddings
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
-    )
+    async def _aembed_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        as_buffer: bool,
+        dtype: str,
+        max_tokens: Optional[int],
+        max_concurrency: int,
+        **kwargs,
+    ) -> List:
+        """Asynchronously embed prepared texts in length-sorted, token-packed
+        batches that are dispatched concurrently."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed(batch: List[str]) -> List:
+            async with semaphore:
+                response = await self._aembed_batch(batch, **kwargs)
+            # convert right away so the raw response is released early
+            return self._process_response(response, as_buffer, dtype)
+
+        # counting tokens is CPU bound, so pack off the event loop
+        order, batches = await asyncio.to_thread(
+            self._prepare_batches, texts, max_tokens, batch_size
+        )
+        tasks = [asyncio.create_task(_embed(batch)) for batch in batches]
+
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # stop the remaining batches rather than letting them keep
+            # retrying after the failure has reached the caller
+            for task in tasks:
+                task.cancel()
+            raise
+
+        embeddings: List = []
+        for result in results:
+            embeddings += result
+        return self._restore_order(order, embeddings)
+
     async def aembed(
         self,
         text: str,
         preprocess: Optional[Callable] = None,
         as_buffer: bool = False,
+        dtype: str = "float32",
         **kwargs,
     ) -> List[float]:
         """Asynchronously embed a chunk of text using the OpenAI API.
@@ -252,6 +946,11 @@ class OpenAITextVectorizer(BaseVectorizer):
                 perform before vectorization. Defaults to None.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            dtype (str, optional): The datatype of the byte string when
+                `as_buffer` is set, either "float32" or "float64". Defaults
+                to "float32".
+            **kwargs: Additional options for the embeddings request, such as
+                `dimensions`.
 
         Returns:
             List[float]: Embedding.
@@ -261,8 +960,220 @@ class OpenAITextVectorizer(BaseVectorizer):
         """
         if not isinstance(text, str):
             raise TypeError("Must pass in a str value to embed.")
+        dtype = _validate_dtype(dtype)
 
         if preprocess:
-            text = preprocess(text)
-        result = await self._aclient.embeddings.create(input=[text], model=self.model)
-        return self._process_embedding(result.data[0].embedding, as_buffer)
+            text = await asyncio.to_thread(preprocess, text)
+        options = self._options_key(kwargs)
+        if options is None:
+            return await self._aembed_uncached(text, as_buffer, dtype, **kwargs)
+
+        key = (text, as_buffer, dtype, options)
+        if self._acache is not None and key in self._acache:
+            self._acache.move_to_end(key)
+            return self._copy_embedding(self._acache[key])
+
+        # concurrent calls for the same text share a single API request; the
+        # lookup and insert below do not yield to the loop, so need no lock
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._aembed_uncached(text, as_buffer, dtype, **kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result = await asyncio.shield(task)
+
+        if self._acache is not None:
+            self._acache[key] = result
+            if len(self._acache) > self._cache_size:
+                self._acache.popitem(last=False)
+        return self._copy_embedding(result)
+
+    async def _aembed_uncached(
+        self, text: str, as_buffer: bool, dtype: str, **kwargs
+    ) -> List[float]:
+        result = await self._aembed_batch([text], **kwargs)
+        return self._process_response(result, as_buffer, dtype)[0]
+
+
+class BatchingOpenAITextVectorizer(OpenAITextVectorizer):
+    """The BatchingOpenAITextVectorizer class is an OpenAITextVectorizer that
+    groups concurrent `aembed` calls into batched API requests.
+
+    Services that embed one text per incoming request would otherwise send a
+    single-input request for each call. Instead, texts passed to `aembed` are
+    queued and flushed together once `max_batch` texts are waiting or
+    `flush_interval_ms` has passed since the first of them arrived, trading
+    at most that interval of added latency for far fewer requests under
+    concurrent load. All other methods behave as in OpenAITextVectorizer.
+
+    .. code-block:: python
+
+        vectorizer = BatchingOpenAITextVectorizer(
+            model="text-embedding-ada-002",
+            flush_interval_ms=10,
+            max_batch=256,
+        )
+
+        # concurrent calls are embedded in a single request
+        embeddings = await asyncio.gather(
+            vectorizer.aembed("Hello, world!"),
+            vectorizer.aembed("How are you?"),
+        )
+
+    """
+
+    _flush_interval: float = PrivateAttr(default=0.01)
+    _max_batch: int = PrivateAttr(default=256)
+    _max_tokens: Optional[int] = PrivateAttr(default=None)
+    _max_concurrency: int = PrivateAttr(default=5)
+    _loop: Any = PrivateAttr(default=None)
+    _queue: Any = PrivateAttr(default=None)
+    _flusher: Any = PrivateAttr(default=None)
+    _flushes: Any = PrivateAttr(default_factory=set)
+
+    def __init__(
+        self,
+        model: str = "text-embedding-ada-002",
+        api_config: Optional[Dict] = None,
+        flush_interval_ms: int = 10,
+        max_batch: int = 256,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 5,
+        **kwargs,
+    ):
+        """Initialize the batching OpenAI vectorizer.
+
+        Args:
+            model (str): Model to use for embedding. Defaults to
+                'text-embedding-ada-002'.
+            api_config (Optional[Dict], optional): Dictionary containing the
+                API key and any additional OpenAI API options. Defaults to None.
+            flush_interval_ms (int, optional): Longest time in milliseconds a
+                queued text waits for others to join its batch. Defaults to 10.
+            max_batch (int, optional): Number of queued texts that triggers an
+                immediate flush. Defaults to 256.
+            max_tokens (Optional[int], optional): Maximum number of tokens,
+                summed across texts, to send in a single request. Defaults to
+                None, which uses OpenAI's per-request limit of 300,000.
+            max_concurrency (int, optional): The maximum number of requests
+                in flight at once for a single flush. Defaults to 5.
+            **kwargs: Additional OpenAITextVectorizer options, such as
+                `cache_size`.
+
+        Raises:
+            ImportError: If the openai library is not installed.
+            ValueError: If the OpenAI API key is not provided, or the flush
+                interval, batch size or concurrency are not positive.
+        """
+        if flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms must be a positive integer.")
+        if max_batch <= 0:
+            raise ValueError("max_batch must be a positive integer.")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer.")
+        super().__init__(model=model, api_config=api_config, **kwargs)
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_batch = min(max_batch, _MAX_INPUTS_PER_REQUEST)
+        self._max_tokens = max_tokens
+        self._max_concurrency = max_concurrency
+
+    def _ensure_flusher(self):
+        """Start the background flusher on the running event loop, restarting
+        it if the vectorizer has moved to a new loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._flusher is None or self._flusher.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._flusher = loop.create_task(self._flush_loop())
+
+    async def aclose(self):
+        """Stop the background flusher, cancelling queued and in-flight
+        `aembed` calls. The flusher restarts on the next `aembed` call."""
+        tasks = [task for task in [self._flusher, *self._flushes] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        while self._queue is not None and not self._queue.empty():
+            self._cancel_batch([self._queue.get_nowait()])
+        self._loop = self._queue = self._flusher = None
+
+    async def _aembed_uncached(
+        self, text: str, as_buffer: bool, dtype: str, **kwargs
+    ) -> List[float]:
+        options = self._options_key(kwargs)
+        if options is None:
+            return await super()._aembed_uncached(text, as_buffer, dtype, **kwargs)
+
+        self._ensure_flusher()
+        future = self._loop.create_future()
+        self._queue.put_nowait((text, options, future))
+        buffer = await future
+        return _convert_buffers([buffer], as_buffer, dtype)[0]
+
+    async def _flush_loop(self):
+        """Collect queued texts into batches and flush each one without
+        waiting for earlier flushes to complete."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self._flush_interval
+            try:
+                while len(batch) < self._max_batch:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                self._cancel_batch(batch)
+                raise
+
+            # keep a reference so the flush task is not garbage collected
+            flush = asyncio.ensure_future(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[str, Tuple, Any]]):
+        """Embed a batch of queued texts, in one request per distinct set of
+        request options, and resolve each caller's future with its float32
+        buffer."""
+        groups: Dict[Tuple, List[Tuple[str, Tuple, Any]]] = {}
+        for item in batch:
+            groups.setdefault(item[1], []).append(item)
+        await asyncio.gather(
+            *(self._flush_group(options, items) for options, items in groups.items())
+        )
+
+    async def _flush_group(self, options: Tuple, batch: List[Tuple[str, Tuple, Any]]):
+        texts = [text for text, _, _ in batch]
+        try:
+            buffers = await self._aembed_texts(
+                texts,
+                self._max_batch,
+                True,
+                "float32",
+                max_tokens=self._max_tokens,
+                max_concurrency=self._max_concurrency,
+                **dict(options),
+            )
+        except asyncio.CancelledError:
+            self._cancel_batch(batch)
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), buffer in zip(batch, buffers):
+            if not future.done():
+                future.set_result(buffer)
+
+    @staticmethod
+    def _cancel_batch(batch: List[Tuple[str, Tuple, Any]]):
+        for _, _, future in batch:
+            future.cancel()
@@ -1,9 +1,11 @@
+import asyncio
 import os
 
 import pytest
 
 from redisvl.utils.vectorize import (
     AzureOpenAITextVectorizer,
+    BatchingOpenAITextVectorizer,
     CohereTextVectorizer,
     CustomTextVectorizer,
     HFTextVectorizer,
@@ -278,3 +280,49 @@ async def test_avectorizer_bad_input(avectorizer):
 
     with pytest.raises(TypeError):
         avectorizer.embed_many(42)
+
+
+def test_openai_vectorizer_cache(skip_vectorizer):
+    if skip_vectorizer:
+        pytest.skip("Skipping vectorizer instantiation...")
+
+    vectorizer = OpenAITextVectorizer(cache_size=8)
+    embedding = vectorizer.embed("This is a test sentence.")
+    assert vectorizer.embed("This is a test sentence.") == embedding
+    assert vectorizer._cache.cache_info().hits == 1
+
+    # returned embeddings are copies of the cache entry
+    embedding.append(1.0)
+    assert len(vectorizer.embed("This is a test sentence.")) == vectorizer.dims
+
+
+def test_openai_vectorizer_persistent_cache(skip_vectorizer, tmp_path):
+    if skip_vectorizer:
+        pytest.skip("Skipping vectorizer instantiation...")
+
+    path = str(tmp_path / "embeddings.db")
+    texts = ["This is the first test sentence.", "This is the second test sentence."]
+    embeddings = OpenAITextVectorizer(persistent_cache_path=path).embed_many(texts)
+
+    # a new vectorizer reads the persisted embeddings back
+    vectorizer = OpenAITextVectorizer(persistent_cache_path=path)
+    assert vectorizer._persistent_cache.get_many(texts)[0] is not None
+    cached = vectorizer.embed_many(texts)
+    assert len(cached) == len(texts)
+    assert all(len(emb) == vectorizer.dims for emb in cached)
+    assert cached == embeddings
+
+
+@pytest.mark.asyncio
+async def test_batching_openai_vectorizer_aembed(skip_vectorizer):
+    if skip_vectorizer:
+        pytest.skip("Skipping vectorizer instantiation...")
+
+    vectorizer = BatchingOpenAITextVectorizer(flush_interval_ms=50)
+    texts = ["This is the first test sentence.", "This is the second test sentence."]
+    embeddings = await asyncio.gather(*[vectorizer.aembed(text) for text in texts])
+
+    assert len(embeddings) == len(texts)
+    assert all(
+        isinstance(emb, list) and len(emb) == vectorizer.dims for emb in embeddings
+    )
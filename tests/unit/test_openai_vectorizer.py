@@ -0,0 +1,485 @@
+import asyncio
+import base64
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("openai")
+
+from redisvl.redis.utils import array_to_buffer
+from redisvl.utils.vectorize import BatchingOpenAITextVectorizer, OpenAITextVectorizer
+from redisvl.utils.vectorize.text.openai import (
+    _ASYNC_CLIENT_CACHE,
+    _convert_buffers,
+    _parse_duration,
+    _retry_after,
+    _wait_retry_after,
+)
+
+
+def fake_embedding(text, dimensions=None):
+    return [float(len(text)), 1.0, 2.0, 3.0][:dimensions]
+
+
+def fake_base64_embedding(text, dimensions=None):
+    return base64.b64encode(
+        np.asarray(fake_embedding(text, dimensions), dtype="<f4").tobytes()
+    ).decode()
+
+
+def fake_response(input, encoding_format=None, dimensions=None, **kwargs):
+    encode = fake_embedding
+    if encoding_format == "base64":
+        encode = fake_base64_embedding
+    return SimpleNamespace(
+        data=[SimpleNamespace(embedding=encode(text, dimensions)) for text in input]
+    )
+
+
+class StubEmbeddings:
+    """Stands in for the OpenAI embeddings resource, recording each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def _response(self, input, **kwargs):
+        self.requests.append(list(input))
+        return fake_response(input, **kwargs)
+
+    def create(self, input, model, **kwargs):
+        return self._response(input, **kwargs)
+
+
+class AsyncStubEmbeddings(StubEmbeddings):
+    async def create(self, input, model, **kwargs):
+        return self._response(input, **kwargs)
+
+
+@pytest.fixture
+def vectorizer():
+    vectorizer = OpenAITextVectorizer(api_config={"api_key": "fake"})
+    vectorizer._client = SimpleNamespace(embeddings=StubEmbeddings())
+    vectorizer._aclient = SimpleNamespace(embeddings=AsyncStubEmbeddings())
+    # count one token per character so the limits are easy to reason about
+    vectorizer._encoder = SimpleNamespace(encode=lambda text, **kwargs: text)
+    return vectorizer
+
+
+def test_pack_batches_item_limit(vectorizer):
+    batches = list(vectorizer._pack_batches(["a"] * 5, None, 2))
+    assert batches == [["a", "a"], ["a", "a"], ["a"]]
+
+
+def test_pack_batches_token_limit(vectorizer):
+    texts = ["aaaa", "bbbb", "cc", "dddddd"]
+    batches = list(vectorizer._pack_batches(texts, 10, 100))
+    assert batches == [["aaaa", "bbbb", "cc"], ["dddddd"]]
+
+
+def test_pack_batches_default_token_budget(vectorizer):
+    # long inputs share a request up to the per-request token budget
+    texts = ["a" * 2500] * 100
+    assert len(list(vectorizer._pack_batches(texts, None, 1000))) == 1
+
+
+def test_pack_batches_input_limit(vectorizer):
+    with pytest.raises(ValueError):
+        list(vectorizer._pack_batches(["a" * 8192], None, 10))
+
+
+def test_pack_batches_input_limit_unknown_model():
+    # other models behind OpenAI-compatible endpoints may take longer inputs
+    vectorizer = OpenAITextVectorizer(
+        model="long-context-embedder", api_config={"api_key": "fake", "dimensions": 4}
+    )
+    vectorizer._encoder = SimpleNamespace(encode=lambda text, **kwargs: text)
+    assert list(vectorizer._pack_batches(["a" * 8192], None, 10)) == [["a" * 8192]]
+
+
+def test_pack_batches_invalid_size(vectorizer):
+    with pytest.raises(ValueError):
+        list(vectorizer._pack_batches(["a"], None, 0))
+
+
+async def test_aembed_many_invalid_concurrency(vectorizer):
+    with pytest.raises(ValueError):
+        await vectorizer.aembed_many(["a"], max_concurrency=0)
+
+
+def test_sort_by_length_and_restore_order():
+    texts = ["ccc", "a", "dddd", "bb"]
+    order, sorted_texts = OpenAITextVectorizer._sort_by_length(texts)
+    assert sorted_texts == ["a", "bb", "ccc", "dddd"]
+    assert OpenAITextVectorizer._restore_order(order, sorted_texts) == texts
+
+
+def test_embed_many_preserves_input_order(vectorizer):
+    texts = ["ccc", "a", "dddd", "bb"]
+    embeddings = vectorizer.embed_many(texts, batch_size=2)
+    assert embeddings == [fake_embedding(text) for text in texts]
+    # batches are built from length-sorted texts
+    assert vectorizer._client.embeddings.requests == [["a", "bb"], ["ccc", "dddd"]]
+
+
+async def test_aembed_many_preserves_input_order(vectorizer):
+    texts = ["ccc", "a", "dddd", "bb"]
+    embeddings = await vectorizer.aembed_many(texts, batch_size=2)
+    assert embeddings == [fake_embedding(text) for text in texts]
+
+
+def test_dedupe_and_expand_duplicates(vectorizer):
+    unique, positions = OpenAITextVectorizer._dedupe(["a", "b", "a", "c", "b"])
+    assert unique == ["a", "b", "c"]
+    assert positions == [0, 1, 0, 2, 1]
+
+    items = [[1.0], [2.0], [3.0]]
+    expanded = vectorizer._expand_duplicates(positions, items)
+    assert expanded == [[1.0], [2.0], [1.0], [3.0], [2.0]]
+    # repeated texts receive copies rather than aliases of one list
+    expanded[0].append(9.0)
+    assert expanded[2] == [1.0]
+
+    # without duplicates the items are returned unchanged
+    assert vectorizer._expand_duplicates([0, 1, 2], items) is items
+
+
+def test_embed_many_dedupe(vectorizer):
+    texts = ["a", "bb", "a", "a"]
+    embeddings = vectorizer.embed_many(texts)
+    assert embeddings == [fake_embedding(text) for text in texts]
+    assert vectorizer._client.embeddings.requests == [["a", "bb"]]
+
+    embeddings = vectorizer.embed_many(texts, dedupe=False)
+    assert embeddings == [fake_embedding(text) for text in texts]
+    assert len(vectorizer._client.embeddings.requests[-1]) == len(texts)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_convert_buffers(dtype):
+    vectors = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    buffers = [array_to_buffer(vector) for vector in vectors]
+
+    assert _convert_buffers(buffers, False, dtype) == vectors
+    assert _convert_buffers(buffers, True, dtype) == [
+        array_to_buffer(vector, dtype=dtype) for vector in vectors
+    ]
+    assert _convert_buffers([], True, dtype) == []
+
+
+def test_convert_buffers_mismatched_dimensions():
+    buffers = [array_to_buffer([1.0, 2.0]), array_to_buffer([1.0, 2.0, 3.0])]
+    with pytest.raises(ValueError):
+        _convert_buffers(buffers, False, "float32")
+
+
+def test_convert_buffers_float32_passthrough():
+    buffers = [array_to_buffer([1.0, 2.0])]
+    assert _convert_buffers(buffers, True, "float32") is buffers
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_embed_dtype(vectorizer, dtype):
+    expected = array_to_buffer(fake_embedding("abc"), dtype=dtype)
+    assert vectorizer.embed("abc", as_buffer=True, dtype=dtype) == expected
+    assert vectorizer.embed_many(["abc"], as_buffer=True, dtype=dtype) == [expected]
+    # JSON float responses are converted the same way
+    assert vectorizer.embed_many(
+        ["abc"], as_buffer=True, dtype=dtype, encoding_format="float"
+    ) == [expected]
+
+
+def test_embed_request_options(vectorizer):
+    assert vectorizer.embed("abc", dimensions=2) == fake_embedding("abc", 2)
+    assert vectorizer.embed("abc") == fake_embedding("abc")
+
+
+async def test_aembed_request_options(vectorizer):
+    assert await vectorizer.aembed("abc", dimensions=2) == fake_embedding("abc", 2)
+    assert await vectorizer.aembed("abc") == fake_embedding("abc")
+
+
+@pytest.mark.parametrize("cache_size", [0, 10])
+async def test_embed_cache_keyed_by_request_options(vectorizer, cache_size):
+    vectorizer._initialize_cache(cache_size)
+    requests = vectorizer._client.embeddings.requests
+
+    # results for different options are cached apart
+    assert vectorizer.embed("abc", dimensions=2) == fake_embedding("abc", 2)
+    assert vectorizer.embed("abc") == fake_embedding("abc")
+    assert vectorizer.embed("abc", dimensions=2) == fake_embedding("abc", 2)
+    assert len(requests) == (2 if cache_size else 3)
+
+    # and concurrent calls with different options are not coalesced
+    embeddings = await asyncio.gather(
+        vectorizer.aembed("abc", dimensions=2), vectorizer.aembed("abc")
+    )
+    assert embeddings == [fake_embedding("abc", 2), fake_embedding("abc")]
+
+
+def test_embed_invalid_dtype(vectorizer):
+    with pytest.raises(ValueError):
+        vectorizer.embed("abc", as_buffer=True, dtype="float16")
+    with pytest.raises(ValueError):
+        vectorizer.embed_many(["abc"], as_buffer=True, dtype="float16")
+
+
+@pytest.fixture
+def embeddings_server():
+    """Serve OpenAI-style embeddings responses on a local port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps(
+                {
+                    "object": "list",
+                    "model": request["model"],
+                    "data": [
+                        {
+                            "object": "embedding",
+                            "index": i,
+                            "embedding": fake_base64_embedding(text),
+                        }
+                        for i, text in enumerate(request["input"])
+                    ],
+                    "usage": {"prompt_tokens": 1, "total_tokens": 1},
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_per_event_loop(embeddings_server):
+    api_config = {"api_key": "fake", "base_url": embeddings_server}
+    first = OpenAITextVectorizer(api_config=dict(api_config))
+    second = OpenAITextVectorizer(api_config=dict(api_config))
+    assert first._client is second._client
+
+    async def embed():
+        clients = await first._get_aclient(), await second._get_aclient()
+        assert await first.aembed_many(["a", "bb"]) == [
+            fake_embedding("a"),
+            fake_embedding("bb"),
+        ]
+        return clients
+
+    # clients are shared within a loop but never reused by a later loop
+    clients = asyncio.run(embed())
+    assert clients[0] is clients[1]
+    assert asyncio.run(embed())[0] is not clients[0]
+
+    # the clients and their open connections are released with their loop
+    assert not _ASYNC_CLIENT_CACHE
+    assert clients[0].is_closed()
+
+
+def failed_request(headers, status_code=429):
+    error = Exception()
+    error.response = SimpleNamespace(headers=headers, status_code=status_code)
+    return error
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1m2s", 62.0), ("20ms", 0.02), ("6.5s", 6.5), ("1h", 3600.0), ("soon", None)],
+)
+def test_parse_duration(value, expected):
+    assert _parse_duration(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after": "7"}, 7.0),
+        ({"retry-after-ms": "1500", "retry-after": "7"}, 1.5),
+        ({"x-ratelimit-reset-requests": "1m2s"}, 62.0),
+        (
+            {"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "3s"},
+            3.0,
+        ),
+        ({}, None),
+    ],
+)
+def test_retry_after(headers, expected):
+    assert _retry_after(failed_request(headers)) == pytest.approx(expected)
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    headers = {"retry-after": format_datetime(retry_at, usegmt=True)}
+    assert _retry_after(failed_request(headers)) == pytest.approx(30, abs=2)
+
+
+def test_retry_after_ignores_reset_headers_unless_rate_limited():
+    headers = {"x-ratelimit-reset-requests": "1m2s"}
+    assert _retry_after(failed_request(headers, status_code=500)) is None
+    assert _retry_after(Exception()) is None
+
+
+def test_wait_retry_after_honors_server_delay():
+    wait = _wait_retry_after(lambda retry_state: 1.0)
+
+    def retry_state(error):
+        outcome = SimpleNamespace(exception=lambda: error)
+        return SimpleNamespace(outcome=outcome)
+
+    # server delays are not cut short
+    error = failed_request({"retry-after": "30"})
+    assert 30 <= wait(retry_state(error)) <= 30.25
+    assert wait(retry_state(Exception())) == 1.0
+
+    # but delays beyond the limit fail fast with the original error
+    error = failed_request({"x-ratelimit-reset-tokens": "1h"})
+    with pytest.raises(Exception) as excinfo:
+        wait(retry_state(error))
+    assert excinfo.value is error
+
+
+def test_embed_fails_fast_on_long_retry_after(vectorizer):
+    error = failed_request({"retry-after": "3600"})
+
+    def create(**kwargs):
+        vectorizer._client.embeddings.requests.append(kwargs["input"])
+        raise error
+
+    vectorizer._client.embeddings.create = create
+    with pytest.raises(Exception) as excinfo:
+        vectorizer.embed("abc")
+    assert excinfo.value is error
+    assert len(vectorizer._client.embeddings.requests) == 1
+
+
+def test_persistent_cache_keyed_by_dimensions(tmp_path):
+    vectorizer = OpenAITextVectorizer(
+        api_config={"api_key": "fake"},
+        persistent_cache_path=str(tmp_path / "embeddings.db"),
+    )
+    vectorizer._client = SimpleNamespace(embeddings=StubEmbeddings())
+    requests = vectorizer._client.embeddings.requests
+
+    assert vectorizer.embed_many(["a", "bb"]) == [
+        fake_embedding("a"),
+        fake_embedding("bb"),
+    ]
+    assert vectorizer.embed_many(["a", "bb"]) == [
+        fake_embedding("a"),
+        fake_embedding("bb"),
+    ]
+    assert requests == [["a", "bb"]]
+
+    # a request for another output size misses the cached embeddings
+    vectorizer.embed_many(["a"], dimensions=256)
+    assert requests == [["a", "bb"], ["a"]]
+
+
+@pytest.fixture
+def batch_requests(monkeypatch):
+    """Stub out batch requests of the batching vectorizer, recording each."""
+    requests = []
+
+    async def stub_aembed_batch(self, batch, **kwargs):
+        requests.append(list(batch))
+        return fake_response(batch, encoding_format="base64", **kwargs)
+
+    monkeypatch.setattr(
+        BatchingOpenAITextVectorizer, "_aembed_batch", stub_aembed_batch
+    )
+    return requests
+
+
+async def test_batching_vectorizer_one_request_per_window(batch_requests):
+    vectorizer = BatchingOpenAITextVectorizer(
+        api_config={"api_key": "fake"}, flush_interval_ms=50
+    )
+    texts = ["a", "bb", "ccc"]
+    embeddings = await asyncio.gather(*map(vectorizer.aembed, texts))
+    assert embeddings == [fake_embedding(text) for text in texts]
+    assert batch_requests == [texts]
+
+    # a call after the window has closed is sent in its own request
+    assert await vectorizer.aembed("dddd") == fake_embedding("dddd")
+    assert batch_requests == [texts, ["dddd"]]
+    await vectorizer.aclose()
+
+
+async def test_batching_vectorizer_max_batch(batch_requests):
+    vectorizer = BatchingOpenAITextVectorizer(
+        api_config={"api_key": "fake"}, flush_interval_ms=1000, max_batch=2
+    )
+    texts = ["a", "bb", "ccc", "dddd"]
+    # full batches are flushed without waiting for the window to close
+    embeddings = await asyncio.wait_for(
+        asyncio.gather(*map(vectorizer.aembed, texts)), timeout=0.5
+    )
+    assert embeddings == [fake_embedding(text) for text in texts]
+    assert batch_requests == [["a", "bb"], ["ccc", "dddd"]]
+    await vectorizer.aclose()
+
+
+async def test_batching_vectorizer_aclose(batch_requests):
+    vectorizer = BatchingOpenAITextVectorizer(
+        api_config={"api_key": "fake"}, flush_interval_ms=1000
+    )
+    pending = asyncio.ensure_future(vectorizer.aembed("a"))
+    await asyncio.sleep(0.01)
+    await vectorizer.aclose()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert batch_requests == []
+
+    # the flusher restarts on the next call
+    pending = asyncio.ensure_future(vectorizer.aembed("bb"))
+    await asyncio.sleep(0.01)
+    assert not vectorizer._flusher.done()
+    await vectorizer.aclose()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"flush_interval_ms": 0}, {"max_batch": 0}, {"max_concurrency": 0}],
+)
+def test_batching_vectorizer_invalid_options(options):
+    with pytest.raises(ValueError):
+        BatchingOpenAITextVectorizer(api_config={"api_key": "fake"}, **options)
+
+
+async def test_batching_vectorizer_request_options(batch_requests):
+    vectorizer = BatchingOpenAITextVectorizer(
+        api_config={"api_key": "fake"}, flush_interval_ms=50
+    )
+    embeddings = await asyncio.gather(
+        vectorizer.aembed("a"),
+        vectorizer.aembed("bb", dimensions=2),
+        vectorizer.aembed("ccc"),
+    )
+    assert embeddings == [
+        fake_embedding("a"),
+        fake_embedding("bb", 2),
+        fake_embedding("ccc"),
+    ]
+    # texts with different options are flushed in separate requests
+    assert sorted(batch_requests) == [["a", "ccc"], ["bb"]]
+    await vectorizer.aclose()
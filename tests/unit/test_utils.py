@@ -7,6 +7,7 @@ from redisvl.redis.utils import (
     convert_bytes,
     make_dict,
 )
+from redisvl.utils.vectorize import CustomTextVectorizer
 
 
 def test_even_number_of_elements():
@@ -150,3 +151,11 @@ def test_conversion_with_invalid_floats():
     array = [float("inf"), float("-inf"), float("nan")]
     result = array_to_buffer(array)
     assert len(result) > 0  # Simple check to ensure it returns anything
+
+
+def test_batchify():
+    vectorizer = CustomTextVectorizer(embed=lambda text: [1.0, 2.0])
+    batches = list(vectorizer.batchify(["a", "b", "c"], 2, preprocess=str.upper))
+    assert batches == [["A", "B"], ["C"]]
+    with pytest.raises(ValueError):
+        list(vectorizer.batchify(["a"], 0))